@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
-"""Generate a high-quality animated badge GIF for Multi-Agent Orchestration status."""
+"""Generate a high-quality animated badge GIF for Multi-Agent Orchestration status.
+
+Usage:
+    python create_badge_gif.py             # Render RGBA frames
+    python create_badge_gif.py --palette   # Render straight into a fixed palette
+"""
 
 from PIL import Image, ImageDraw, ImageFont
 import os
 import random
+import sys
+from fixed_palette import FixedPalette
 
 # 2x resolution for retina displays
 SCALE = 2
@@ -43,17 +50,21 @@ def get_font():
                 continue
     return ImageFont.load_default()
 
-def create_badge_frame(text, bg_color, width, font):
+def create_badge_frame(text, bg_color, width, font, palette=None):
     """Create a single badge frame at 2x resolution."""
-    img = Image.new('RGBA', (width, BADGE_HEIGHT), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    if palette:
+        img = palette.new_image((width, BADGE_HEIGHT), bg_color)
+        fill = palette.fill(bg_color)
+    else:
+        img = Image.new('RGBA', (width, BADGE_HEIGHT), (0, 0, 0, 0))
+        fill = hex_to_rgb(bg_color)
+    draw = palette.draw(img) if palette else ImageDraw.Draw(img)
 
     # Draw rounded rectangle background
-    rgb_color = hex_to_rgb(bg_color)
     draw.rounded_rectangle(
         [(0, 0), (width - 1, BADGE_HEIGHT - 1)],
         radius=CORNER_RADIUS,
-        fill=rgb_color
+        fill=fill
     )
 
     # Calculate text position (left-aligned with padding)
@@ -63,11 +74,14 @@ def create_badge_frame(text, bg_color, width, font):
     y = (BADGE_HEIGHT - text_height) // 2 - (2 * SCALE)
 
     # Draw text in white
-    draw.text((x, y), text, fill=(255, 255, 255), font=font)
+    if palette:
+        palette.draw_text(draw, (x, y), text, font, "#FFFFFF", bg_color)
+    else:
+        draw.text((x, y), text, fill=(255, 255, 255), font=font)
 
     return img
 
-def create_typing_frames(text, bg_color, width, font):
+def create_typing_frames(text, bg_color, width, font, palette=None):
     """Create frames that type out text letter by letter with realistic timing."""
     frames = []
 
@@ -77,19 +91,19 @@ def create_typing_frames(text, bg_color, width, font):
         display = partial + "_" if i < len(text) else partial
         if not display:
             display = "_"
-        frame = create_badge_frame(display, bg_color, width, font)
+        frame = create_badge_frame(display, bg_color, width, font, palette)
         # Vary typing speed: slower for first char, slight randomness
         base_delay = 80 if i == 0 else 55
         delay = base_delay + random.randint(-10, 20)
         frames.append((frame, max(30, delay)))
 
     # Brief pause after finishing typing (no cursor)
-    frame = create_badge_frame(text, bg_color, width, font)
+    frame = create_badge_frame(text, bg_color, width, font, palette)
     frames.append((frame, 300))
 
     return frames
 
-def create_working_dots(base_text, bg_color, width, font, cycles=8):
+def create_working_dots(base_text, bg_color, width, font, cycles=8, palette=None):
     """Create realistic 'working' dots animation - deliberate, not frantic."""
     frames = []
 
@@ -98,21 +112,21 @@ def create_working_dots(base_text, bg_color, width, font, cycles=8):
         for num_dots in range(1, 4):
             dots = "." * num_dots
             text = base_text + dots
-            frame = create_badge_frame(text, bg_color, width, font)
+            frame = create_badge_frame(text, bg_color, width, font, palette)
             # Each dot holds for a moment - feels like "thinking"
             # Vary timing slightly per cycle for organic feel
             hold_time = 350 + random.randint(-50, 100)
             frames.append((frame, hold_time))
 
         # Hold on "..." a bit longer before resetting
-        frames.append((create_badge_frame(base_text + "...", bg_color, width, font), 500 + random.randint(0, 200)))
+        frames.append((create_badge_frame(base_text + "...", bg_color, width, font, palette), 500 + random.randint(0, 200)))
 
     return frames
 
-def create_hold_frames(text, bg_color, width, font, duration_ms=1500):
+def create_hold_frames(text, bg_color, width, font, duration_ms=1500, palette=None):
     """Hold on completed text."""
     frames = []
-    frame = create_badge_frame(text, bg_color, width, font)
+    frame = create_badge_frame(text, bg_color, width, font, palette)
     # Single frame with the duration
     frames.append((frame, duration_ms))
     return frames
@@ -121,8 +135,13 @@ def main():
     random.seed(42)  # Reproducible "randomness"
     font = get_font()
 
+    # Optional fixed palette: white text ramps over every phase colour
+    palette = None
+    if '--palette' in sys.argv[1:]:
+        palette = FixedPalette([(color, "#FFFFFF") for color in COLORS.values()])
+
     # Calculate max width needed (for "Shipping..." which is longest)
-    test_img = Image.new('RGBA', (300, BADGE_HEIGHT))
+    test_img = Image.new('L', (300, BADGE_HEIGHT))
     test_draw = ImageDraw.Draw(test_img)
 
     max_text = "Shipping..."
@@ -136,27 +155,27 @@ def main():
 
     # Phase 1: Planning - type it out, hold, then show "working" dots
     print("  Creating Planning phase...")
-    all_frames.extend(create_typing_frames("Planning", COLORS["planning"], badge_width, font))
-    all_frames.extend(create_working_dots("Planning", COLORS["planning"], badge_width, font, cycles=3))
-    all_frames.extend(create_hold_frames("Planning...", COLORS["planning"], badge_width, font, 800))
+    all_frames.extend(create_typing_frames("Planning", COLORS["planning"], badge_width, font, palette=palette))
+    all_frames.extend(create_working_dots("Planning", COLORS["planning"], badge_width, font, cycles=3, palette=palette))
+    all_frames.extend(create_hold_frames("Planning...", COLORS["planning"], badge_width, font, 800, palette=palette))
 
     # Phase 2: Building - the main work phase, longer dots cycling
     print("  Creating Building phase...")
-    all_frames.extend(create_typing_frames("Building", COLORS["building"], badge_width, font))
-    all_frames.extend(create_working_dots("Building", COLORS["building"], badge_width, font, cycles=12))
-    all_frames.extend(create_hold_frames("Building...", COLORS["building"], badge_width, font, 600))
+    all_frames.extend(create_typing_frames("Building", COLORS["building"], badge_width, font, palette=palette))
+    all_frames.extend(create_working_dots("Building", COLORS["building"], badge_width, font, cycles=12, palette=palette))
+    all_frames.extend(create_hold_frames("Building...", COLORS["building"], badge_width, font, 600, palette=palette))
 
     # Phase 3: Testing - medium duration
     print("  Creating Testing phase...")
-    all_frames.extend(create_typing_frames("Testing", COLORS["testing"], badge_width, font))
-    all_frames.extend(create_working_dots("Testing", COLORS["testing"], badge_width, font, cycles=5))
-    all_frames.extend(create_hold_frames("Testing...", COLORS["testing"], badge_width, font, 800))
+    all_frames.extend(create_typing_frames("Testing", COLORS["testing"], badge_width, font, palette=palette))
+    all_frames.extend(create_working_dots("Testing", COLORS["testing"], badge_width, font, cycles=5, palette=palette))
+    all_frames.extend(create_hold_frames("Testing...", COLORS["testing"], badge_width, font, 800, palette=palette))
 
     # Phase 4: Shipping - shorter, then done
     print("  Creating Shipping phase...")
-    all_frames.extend(create_typing_frames("Shipping", COLORS["shipping"], badge_width, font))
-    all_frames.extend(create_working_dots("Shipping", COLORS["shipping"], badge_width, font, cycles=2))
-    all_frames.extend(create_hold_frames("Shipping...", COLORS["shipping"], badge_width, font, 2000))
+    all_frames.extend(create_typing_frames("Shipping", COLORS["shipping"], badge_width, font, palette=palette))
+    all_frames.extend(create_working_dots("Shipping", COLORS["shipping"], badge_width, font, cycles=2, palette=palette))
+    all_frames.extend(create_hold_frames("Shipping...", COLORS["shipping"], badge_width, font, 2000, palette=palette))
 
     print(f"  Total frames: {len(all_frames)}")
 
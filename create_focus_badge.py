@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
-"""Generate an animated 'current activity' badge with CLI-style status messages."""
+"""Generate an animated 'current activity' badge with CLI-style status messages.
+
+Usage:
+    python create_focus_badge.py             # Render RGBA frames
+    python create_focus_badge.py --palette   # Render straight into a fixed palette
+"""
 
 from PIL import Image, ImageDraw, ImageFont
 import os
 import random
+import sys
+from fixed_palette import FixedPalette
 
 # 2x resolution for retina displays
 SCALE = 2
@@ -46,14 +53,19 @@ def get_font():
                 continue
     return ImageFont.load_default()
 
-def create_frame(text, width, font, text_color=TEXT_COLOR):
+def create_frame(text, width, font, text_color=TEXT_COLOR, palette=None):
     """Create a single frame with terminal styling."""
-    img = Image.new('RGBA', (width, BADGE_HEIGHT), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    if palette:
+        img = palette.new_image((width, BADGE_HEIGHT), BG_COLOR)
+        draw = palette.draw(img)
+        bg_fill = palette.fill(BG_COLOR)
+    else:
+        img = Image.new('RGBA', (width, BADGE_HEIGHT), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        bg_fill = hex_to_rgb(BG_COLOR)
 
     # Draw background
-    bg_rgb = hex_to_rgb(BG_COLOR)
-    draw.rectangle([(0, 0), (width - 1, BADGE_HEIGHT - 1)], fill=bg_rgb)
+    draw.rectangle([(0, 0), (width - 1, BADGE_HEIGHT - 1)], fill=bg_fill)
 
     # Draw text (left-aligned)
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -61,37 +73,40 @@ def create_frame(text, width, font, text_color=TEXT_COLOR):
     x = PADDING_X
     y = (BADGE_HEIGHT - text_height) // 2 - (2 * SCALE)
 
-    text_rgb = hex_to_rgb(text_color)
-    draw.text((x, y), text, fill=text_rgb, font=font)
+    if palette:
+        palette.draw_text(draw, (x, y), text, font, text_color, BG_COLOR)
+    else:
+        text_rgb = hex_to_rgb(text_color)
+        draw.text((x, y), text, fill=text_rgb, font=font)
 
     return img
 
-def create_typing_frames(text, width, font):
+def create_typing_frames(text, width, font, palette=None):
     """Type out CLI command with cursor."""
     frames = []
 
     # Blinking cursor at start
     for _ in range(3):
-        frames.append((create_frame("_", width, font), 200))
-        frames.append((create_frame(" ", width, font), 200))
+        frames.append((create_frame("_", width, font, palette=palette), 200))
+        frames.append((create_frame(" ", width, font, palette=palette), 200))
 
     # Type each character
     for i in range(len(text) + 1):
         partial = text[:i]
         display = partial + "_" if i < len(text) else partial
-        frame = create_frame(display, width, font)
+        frame = create_frame(display, width, font, palette=palette)
         # Faster typing for CLI feel
         delay = 40 + random.randint(-10, 15)
         frames.append((frame, max(25, delay)))
 
     # Hold the result
-    frame = create_frame(text, width, font)
+    frame = create_frame(text, width, font, palette=palette)
     for _ in range(12):
         frames.append((frame, 250))
 
     return frames
 
-def create_processing_frames(text, width, font, cycles=3):
+def create_processing_frames(text, width, font, cycles=3, palette=None):
     """Show processing with spinner or dots."""
     frames = []
     spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -99,7 +114,7 @@ def create_processing_frames(text, width, font, cycles=3):
     for _ in range(cycles):
         for spinner in spinners:
             display = f"{spinner} {text}"
-            frame = create_frame(display, width, font)
+            frame = create_frame(display, width, font, palette=palette)
             frames.append((frame, 80))
 
     return frames
@@ -108,8 +123,13 @@ def main():
     random.seed(42)
     font = get_font()
 
+    # Optional fixed palette: one text ramp over the terminal background
+    palette = None
+    if '--palette' in sys.argv[1:]:
+        palette = FixedPalette([(BG_COLOR, TEXT_COLOR)])
+
     # Calculate max width
-    test_img = Image.new('RGBA', (400, BADGE_HEIGHT))
+    test_img = Image.new('L', (400, BADGE_HEIGHT))
     test_draw = ImageDraw.Draw(test_img)
 
     max_width = 0
@@ -130,14 +150,14 @@ def main():
         print(f"  Creating '{message}'...")
 
         # Type out command/status
-        all_frames.extend(create_typing_frames(message, badge_width, font))
+        all_frames.extend(create_typing_frames(message, badge_width, font, palette=palette))
 
         # Brief processing animation between messages
         if i < len(MESSAGES) - 1:
-            all_frames.extend(create_processing_frames("", badge_width, font, cycles=2))
+            all_frames.extend(create_processing_frames("", badge_width, font, cycles=2, palette=palette))
 
     # Extra hold on last message
-    frame = create_frame(MESSAGES[-1], badge_width, font)
+    frame = create_frame(MESSAGES[-1], badge_width, font, palette=palette)
     for _ in range(8):
         all_frames.append((frame, 300))
 
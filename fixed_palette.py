@@ -0,0 +1,115 @@
+"""
+Fixed-palette rendering shared by the badge and card generators.
+
+Frames are drawn straight into 'P' images using a palette precomputed from the
+known colours and the antialiasing ramps between them, so each frame needs a
+quarter of the memory of an RGBA canvas and the GIF writer has nothing left to
+quantize.
+"""
+
+from PIL import Image, ImageDraw
+
+# GIF palettes hold at most 256 entries
+MAX_COLORS = 256
+# Most shades per text-on-background antialiasing ramp (including both ends)
+RAMP_STEPS = 16
+# Text is measured on an 'L' image so bounding boxes match antialiased rendering
+MEASURE = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+def hex_to_rgb(hex_color):
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+class PaletteDraw(ImageDraw.ImageDraw):
+    """ImageDraw for fixed-palette images.
+
+    Pillow measures text on 'P' images with aliased glyph metrics, which can
+    be several pixels off the antialiased text that draw_text renders.
+    """
+
+    def __init__(self, img):
+        super().__init__(img)
+        self.image = img
+
+    def textbbox(self, *args, **kwargs):
+        return MEASURE.textbbox(*args, **kwargs)
+
+class FixedPalette:
+    """A palette built once from (background, text) colour pairs.
+
+    Every pair contributes a ramp of shades from the background to the text
+    colour; antialiased text coverage is mapped onto that ramp. Ramps get
+    RAMP_STEPS shades while they fit in MAX_COLORS and fewer as pairs are
+    added, down to 2 (no antialiasing) at MAX_COLORS // 2 pairs.
+    """
+
+    def __init__(self, pairs):
+        self.colors = []
+        self.indexes = {}
+        self.ramps = {}
+
+        pairs = list(dict.fromkeys((hex_to_rgb(b), hex_to_rgb(t)) for b, t in pairs))
+        self.steps = min(RAMP_STEPS, MAX_COLORS // max(len(pairs), 1))
+        if self.steps < 2:
+            raise ValueError(
+                f"Fixed palette supports at most {MAX_COLORS // 2} colour pairs, got {len(pairs)}"
+            )
+        # Coverage (0-255) -> nearest ramp step
+        self.step_lut = [(value * (self.steps - 1) + 127) // 255 for value in range(256)]
+
+        for background, text in pairs:
+            self._add_ramp(background, text)
+
+    def _add_color(self, rgb):
+        if rgb not in self.indexes:
+            if len(self.colors) == MAX_COLORS:
+                raise ValueError(f"Fixed palette needs more than {MAX_COLORS} colours")
+            self.indexes[rgb] = len(self.colors)
+            self.colors.append(rgb)
+        return self.indexes[rgb]
+
+    def _add_ramp(self, background, text):
+        ramp = []
+        for step in range(self.steps):
+            t = step / (self.steps - 1)
+            shade = tuple(round(b + (c - b) * t) for b, c in zip(background, text))
+            ramp.append(self._add_color(shade))
+        self.ramps[(background, text)] = ramp
+
+    def fill(self, color):
+        """Palette index for a hex colour."""
+        return self.indexes[hex_to_rgb(color)]
+
+    def getpalette(self):
+        """Flat [r, g, b, ...] list in the form Image.putpalette expects."""
+        return [value for rgb in self.colors for value in rgb]
+
+    def new_image(self, size, color):
+        """Create a 'P' image filled with color and carrying this palette."""
+        img = Image.new('P', size, self.fill(color))
+        img.putpalette(self.getpalette())
+        return img
+
+    def draw(self, img):
+        """Drawing context for an image created by new_image."""
+        return PaletteDraw(img)
+
+    def draw_text(self, draw, xy, text, font, color, background):
+        """Draw antialiased text in color over a solid background region.
+
+        Coverage is snapped to the nearest ramp step and pasted through a
+        1-bit mask, since blending on 'P' images would mix palette indexes
+        rather than colours. draw must come from FixedPalette.draw.
+        """
+        left, top, right, bottom = MEASURE.textbbox(xy, text, font=font)
+        if right <= left or bottom <= top:
+            return
+
+        coverage = Image.new('L', (right - left, bottom - top), 0)
+        ImageDraw.Draw(coverage).text((xy[0] - left, xy[1] - top), text, fill=255, font=font)
+
+        ramp = self.ramps[(hex_to_rgb(background), hex_to_rgb(color))]
+        lut = [ramp[step] for step in self.step_lut]
+        shaded = Image.frombytes('P', coverage.size, coverage.point(lut).tobytes())
+        mask = coverage.point(lambda value: 255 if value else 0, '1')
+        draw.image.paste(shaded, (left, top), mask)
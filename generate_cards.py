@@ -5,17 +5,25 @@ Generate responsive card images from cards.json configuration.
 Usage:
     python generate_cards.py          # Generate all cards
     python generate_cards.py void     # Generate specific card by id
+    python generate_cards.py --palette  # Render straight into a fixed palette
+    python generate_cards.py --cache-badges  # Reuse rendered badges between runs
 """
 
+import hashlib
 import json
 import os
 import sys
 import textwrap
 from PIL import Image, ImageDraw, ImageFont
+from fixed_palette import FixedPalette
 
 # 2x resolution for retina
 SCALE = 2
 
+# Rendered status badges, keyed by (text, color, font, scale, mode)
+BADGE_CACHE = {}
+BADGE_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.badge-cache')
+
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
@@ -64,35 +72,161 @@ def wrap_text(text, font, max_width, draw):
 
     return lines
 
-def draw_status_badge(draw, text, color, x, y, font):
-    """Draw a status badge at position."""
+def font_key(font):
+    """Identify a font across separately loaded instances and runs.
+
+    Fonts loaded from a file also include its path, size and mtime, so cached
+    badges are dropped when the font file is replaced or updated.
+    """
+    if not hasattr(font, 'getname'):
+        return (type(font).__name__,)
+    key = font.getname() + (font.size,)
+    path = getattr(font, 'path', None)
+    if isinstance(path, str) and os.path.exists(path):
+        stat = os.stat(path)
+        key += (path, stat.st_size, stat.st_mtime_ns)
+    return key
+
+def badge_key(text, color, font, palette=None):
+    return (text, color.upper(), font_key(font), SCALE, 'P' if palette else 'RGBA')
+
+def render_status_badge(text, color, font, palette=None):
+    """Render a status badge on its own, sized to fit its text."""
     padding_x = 8 * SCALE
     padding_y = 4 * SCALE
 
-    bbox = draw.textbbox((0, 0), text, font=font)
+    measure = ImageDraw.Draw(Image.new('L', (1, 1)))
+    bbox = measure.textbbox((0, 0), text, font=font)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
-    badge_width = text_width + padding_x * 2
-    badge_height = text_height + padding_y * 2
+    # The badge rectangle includes its right and bottom edges
+    size = (text_width + padding_x * 2 + 1, text_height + padding_y * 2 + 1)
 
     # Draw badge background
-    draw.rectangle(
-        [(x, y), (x + badge_width, y + badge_height)],
-        fill=hex_to_rgb(color)
-    )
+    if palette:
+        img = palette.new_image(size, color)
+        draw = palette.draw(img)
+    else:
+        img = Image.new('RGBA', size, hex_to_rgb(color) + (255,))
+        draw = ImageDraw.Draw(img)
 
     # Draw text
-    draw.text(
-        (x + padding_x, y + padding_y - 2 * SCALE),
-        text,
-        fill=(255, 255, 255),
-        font=font
-    )
+    text_xy = (padding_x, padding_y - 2 * SCALE)
+    if palette:
+        palette.draw_text(draw, text_xy, text, font, "#FFFFFF", color)
+    else:
+        draw.text(text_xy, text, fill=(255, 255, 255), font=font)
+
+    return img
+
+def get_status_badge(text, color, font, palette=None):
+    """Return a cached badge, rendering it on first use."""
+    key = badge_key(text, color, font, palette)
+    badge = BADGE_CACHE.get(key)
+    if badge is None:
+        badge = render_status_badge(text, color, font, palette)
+        BADGE_CACHE[key] = badge
+    return badge
+
+def warm_badge_cache(config, font, palette=None):
+    """Pre-render a badge for every entry in status_colors."""
+    for text, color in config.get('status_colors', {}).items():
+        get_status_badge(text, color, font, palette)
+
+def load_badge_cache(cache_dir, palette=None):
+    """Load badges persisted by save_badge_cache.
+
+    Palette badges are only reused if they were rendered with the same palette.
+    """
+    index_path = os.path.join(cache_dir, 'index.json')
+    if not os.path.exists(index_path):
+        return
+    with open(index_path, 'r') as f:
+        entries = json.load(f)
+
+    for entry in entries:
+        key = (entry['text'], entry['color'], tuple(entry['font']), entry['scale'], entry['mode'])
+        if key[3] != SCALE or key[4] != ('P' if palette else 'RGBA'):
+            continue
+        path = os.path.join(cache_dir, entry['file'])
+        if not os.path.exists(path):
+            continue
+        with Image.open(path) as badge:
+            badge.load()
+            if palette and badge.getpalette() != palette.getpalette():
+                continue
+            BADGE_CACHE[key] = badge.copy()
+
+def save_badge_cache(cache_dir):
+    """Persist every cached badge as a PNG plus an index of their keys.
+
+    Entries for other modes or scales already in the index are kept.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, 'index.json')
+    entries = {}
+    if os.path.exists(index_path):
+        with open(index_path, 'r') as f:
+            entries = {entry['file']: entry for entry in json.load(f)}
+
+    for key, badge in BADGE_CACHE.items():
+        text, color, font, scale, mode = key
+        name = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16] + '.png'
+        badge.save(os.path.join(cache_dir, name), 'PNG')
+        entries[name] = {
+            'text': text,
+            'color': color,
+            'font': list(font),
+            'scale': scale,
+            'mode': mode,
+            'file': name,
+        }
+
+    with open(index_path, 'w') as f:
+        json.dump(list(entries.values()), f, indent=2)
+
+def draw_status_badge(img, text, color, x, y, font, palette=None):
+    """Paste a status badge at position."""
+    badge = get_status_badge(text, color, font, palette)
+    img.paste(badge, (x, y))
+    return badge.width - 1, badge.height - 1
+
+def new_card_canvas(width, height, theme, palette=None):
+    """Create a card canvas filled with the theme background."""
+    if palette:
+        img = palette.new_image((width, height), theme['background'])
+        return img, palette.draw(img)
+    img = Image.new('RGBA', (width, height), hex_to_rgb(theme['background']) + (255,))
+    return img, ImageDraw.Draw(img)
+
+def draw_card_text(draw, xy, text, color, font, theme, palette=None):
+    """Draw text in a hex colour over the card background."""
+    if palette:
+        palette.draw_text(draw, xy, text, font, color, theme['background'])
+    else:
+        draw.text(xy, text, fill=hex_to_rgb(color), font=font)
+
+def build_palette(config):
+    """Fixed palette covering every text/background pair the cards use."""
+    theme = config['theme']
+    pairs = [
+        (theme['background'], theme[key])
+        for key in ('text_primary', 'text_secondary', 'text_muted')
+    ]
+
+    badge_colors = list(config.get('status_colors', {}).values())
+    for card in config['cards']:
+        status = card['status']
+        if status['type'] == 'animated':
+            badge_colors.extend(phase['color'] for phase in status['phases'])
+        else:
+            badge_colors.append(status['color'])
+    pairs.extend((color, "#FFFFFF") for color in badge_colors)
 
-    return badge_width, badge_height
+    return FixedPalette(pairs)
 
-def create_static_card(card, theme):
+def create_static_card(card, theme, palette=None):
     """Create a static PNG card."""
     width = theme['card_width'] * SCALE
     padding = theme['card_padding'] * SCALE
@@ -105,7 +239,7 @@ def create_static_card(card, theme):
     font_badge = get_font(10)
 
     # Calculate content height
-    test_img = Image.new('RGBA', (width, 1000), (0, 0, 0, 0))
+    test_img = Image.new('L', (width, 1000), 0)
     test_draw = ImageDraw.Draw(test_img)
 
     content_width = width - padding * 2
@@ -122,8 +256,7 @@ def create_static_card(card, theme):
     total_height = padding + badge_height + 8 * SCALE + title_height + 12 * SCALE + desc_height + 16 * SCALE + tagline_height + padding
 
     # Create image
-    img = Image.new('RGBA', (width, int(total_height)), hex_to_rgb(theme['background']) + (255,))
-    draw = ImageDraw.Draw(img)
+    img, draw = new_card_canvas(width, int(total_height), theme, palette)
 
     y = padding
 
@@ -132,49 +265,58 @@ def create_static_card(card, theme):
     badge_bbox = draw.textbbox((0, 0), status['text'], font=font_badge)
     badge_text_width = badge_bbox[2] - badge_bbox[0]
     badge_x = width - padding - badge_text_width - 16 * SCALE
-    draw_status_badge(draw, status['text'], status['color'], badge_x, y, font_badge)
+    draw_status_badge(img, status['text'], status['color'], badge_x, y, font_badge, palette)
 
     y += badge_height + 8 * SCALE
 
     # Icon + Title
     icon_text = card['icon']
-    draw.text((padding, y), icon_text, fill=hex_to_rgb(theme['text_secondary']), font=font_icon)
+    draw_card_text(draw, (padding, y), icon_text, theme['text_secondary'], font_icon, theme, palette)
 
     icon_bbox = draw.textbbox((0, 0), icon_text, font=font_icon)
     icon_width = icon_bbox[2] - icon_bbox[0]
 
-    draw.text(
+    draw_card_text(
+        draw,
         (padding + icon_width + 10 * SCALE, y),
         card['title'],
-        fill=hex_to_rgb(theme['text_primary']),
-        font=font_title
+        theme['text_primary'],
+        font_title,
+        theme,
+        palette
     )
 
     y += title_height + 12 * SCALE
 
     # Description
     for line in desc_lines:
-        draw.text(
+        draw_card_text(
+            draw,
             (padding, y),
             line,
-            fill=hex_to_rgb(theme['text_secondary']),
-            font=font_body
+            theme['text_secondary'],
+            font_body,
+            theme,
+            palette
         )
         y += 20 * SCALE
 
     y += 8 * SCALE
 
     # Tagline
-    draw.text(
+    draw_card_text(
+        draw,
         (padding, y),
         card['tagline'],
-        fill=hex_to_rgb(theme['text_primary']),
-        font=font_tagline
+        theme['text_primary'],
+        font_tagline,
+        theme,
+        palette
     )
 
     return img
 
-def create_animated_card(card, theme):
+def create_animated_card(card, theme, palette=None):
     """Create an animated GIF card with cycling status."""
     width = theme['card_width'] * SCALE
     padding = theme['card_padding'] * SCALE
@@ -187,7 +329,7 @@ def create_animated_card(card, theme):
     font_badge = get_font(10)
 
     # Calculate content height (same as static)
-    test_img = Image.new('RGBA', (width, 1000), (0, 0, 0, 0))
+    test_img = Image.new('L', (width, 1000), 0)
     test_draw = ImageDraw.Draw(test_img)
     content_width = width - padding * 2
     desc_lines = wrap_text(card['description'], font_body, content_width, test_draw)
@@ -212,8 +354,7 @@ def create_animated_card(card, theme):
 
         # Type out the phase name
         for i in range(len(phase_text) + 1):
-            img = Image.new('RGBA', (width, int(total_height)), hex_to_rgb(theme['background']) + (255,))
-            draw = ImageDraw.Draw(img)
+            img, draw = new_card_canvas(width, int(total_height), theme, palette)
 
             y = padding
 
@@ -222,12 +363,12 @@ def create_animated_card(card, theme):
             badge_bbox = draw.textbbox((0, 0), display_text, font=font_badge)
             badge_text_width = badge_bbox[2] - badge_bbox[0]
             badge_x = width - padding - badge_text_width - 16 * SCALE - 50 * SCALE  # Extra space for dots
-            draw_status_badge(draw, display_text, phase_color, badge_x, y, font_badge)
+            draw_status_badge(img, display_text, phase_color, badge_x, y, font_badge, palette)
 
             y += badge_height + 8 * SCALE
 
             # Rest of card (static content)
-            draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines)
+            draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines, palette)
 
             frames.append(img)
             durations.append(50)
@@ -235,8 +376,7 @@ def create_animated_card(card, theme):
         # Dot cycling for this phase
         for _ in range(dot_cycles):
             for num_dots in range(1, 4):
-                img = Image.new('RGBA', (width, int(total_height)), hex_to_rgb(theme['background']) + (255,))
-                draw = ImageDraw.Draw(img)
+                img, draw = new_card_canvas(width, int(total_height), theme, palette)
 
                 y = padding
 
@@ -245,62 +385,71 @@ def create_animated_card(card, theme):
                 badge_bbox = draw.textbbox((0, 0), display_text, font=font_badge)
                 badge_text_width = badge_bbox[2] - badge_bbox[0]
                 badge_x = width - padding - badge_text_width - 16 * SCALE
-                draw_status_badge(draw, display_text, phase_color, badge_x, y, font_badge)
+                draw_status_badge(img, display_text, phase_color, badge_x, y, font_badge, palette)
 
                 y += badge_height + 8 * SCALE
 
-                draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines)
+                draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines, palette)
 
                 frames.append(img)
                 durations.append(300)
 
     return frames, durations
 
-def draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines):
+def draw_static_content(draw, card, theme, y, padding, width, font_icon, font_title, font_body, font_tagline, desc_lines, palette=None):
     """Draw the static portions of a card (icon, title, description, tagline)."""
     # Icon + Title
     icon_text = card['icon']
-    draw.text((padding, y), icon_text, fill=hex_to_rgb(theme['text_secondary']), font=font_icon)
+    draw_card_text(draw, (padding, y), icon_text, theme['text_secondary'], font_icon, theme, palette)
 
     icon_bbox = draw.textbbox((0, 0), icon_text, font=font_icon)
     icon_width = icon_bbox[2] - icon_bbox[0]
 
-    draw.text(
+    draw_card_text(
+        draw,
         (padding + icon_width + 10 * SCALE, y),
         card['title'],
-        fill=hex_to_rgb(theme['text_primary']),
-        font=font_title
+        theme['text_primary'],
+        font_title,
+        theme,
+        palette
     )
 
     y += 24 * SCALE + 12 * SCALE
 
     # Description
     for line in desc_lines:
-        draw.text(
+        draw_card_text(
+            draw,
             (padding, y),
             line,
-            fill=hex_to_rgb(theme['text_secondary']),
-            font=font_body
+            theme['text_secondary'],
+            font_body,
+            theme,
+            palette
         )
         y += 20 * SCALE
 
     y += 8 * SCALE
 
     # Tagline
-    draw.text(
+    draw_card_text(
+        draw,
         (padding, y),
         card['tagline'],
-        fill=hex_to_rgb(theme['text_primary']),
-        font=font_tagline
+        theme['text_primary'],
+        font_tagline,
+        theme,
+        palette
     )
 
-def generate_card(card, theme, output_dir):
+def generate_card(card, theme, output_dir, palette=None):
     """Generate a card (PNG or GIF based on status type)."""
     card_id = card['id']
     status_type = card['status']['type']
 
     if status_type == 'animated':
-        frames, durations = create_animated_card(card, theme)
+        frames, durations = create_animated_card(card, theme, palette)
         output_path = os.path.join(output_dir, f"card-{card_id}.gif")
 
         frames[0].save(
@@ -313,7 +462,7 @@ def generate_card(card, theme, output_dir):
         )
         print(f"  ✓ {card_id}: GIF ({len(frames)} frames)")
     else:
-        img = create_static_card(card, theme)
+        img = create_static_card(card, theme, palette)
         output_path = os.path.join(output_dir, f"card-{card_id}.png")
         img.save(output_path, 'PNG')
         print(f"  ✓ {card_id}: PNG")
@@ -333,9 +482,18 @@ def main():
     output_dir = os.path.join(os.path.dirname(__file__), 'assets', 'cards')
     os.makedirs(output_dir, exist_ok=True)
 
+    args = sys.argv[1:]
+    palette = build_palette(config) if '--palette' in args else None
+
+    # Render each known status badge once; cards paste from the cache
+    cache_badges = '--cache-badges' in args
+    if cache_badges:
+        load_badge_cache(BADGE_CACHE_DIR, palette)
+    warm_badge_cache(config, get_font(10), palette)
+
     # Filter cards if specific ID provided
-    if len(sys.argv) > 1:
-        card_ids = sys.argv[1:]
+    card_ids = [a for a in args if not a.startswith('--')]
+    if card_ids:
         cards = [c for c in cards if c['id'] in card_ids]
         if not cards:
             print(f"No cards found with IDs: {card_ids}")
@@ -344,7 +502,10 @@ def main():
     print(f"Generating {len(cards)} cards...")
 
     for card in cards:
-        generate_card(card, theme, output_dir)
+        generate_card(card, theme, output_dir, palette)
+
+    if cache_badges:
+        save_badge_cache(BADGE_CACHE_DIR)
 
     print(f"\nCards saved to {output_dir}/")
     print("\nTo use in README (responsive layout):")
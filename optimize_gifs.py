@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Losslessly re-optimize committed GIF assets.
+
+Decodes every frame to a full composited canvas, merges identical consecutive
+frames, maps all frames onto one shared palette and re-encodes them as
+changed-region deltas. GIFs with transparent pixels have to restore to the
+background between frames, so their frames are only cropped to the area that
+is not transparent. Nothing is written unless every composited frame of the
+result is pixel-identical to the original at the same timestamps.
+
+Usage:
+    python optimize_gifs.py                        # Optimize every GIF under assets/
+    python optimize_gifs.py assets/status-focus.gif
+    python optimize_gifs.py --verify               # Dry run: verify and report only
+"""
+
+import io
+import os
+import sys
+from PIL import Image, ImageChops, ImageSequence
+
+# GIF palettes hold at most 256 entries
+MAX_COLORS = 256
+CLEAR = (0, 0, 0, 0)
+
+def find_gifs(root):
+    """Find all GIF files below root, sorted for stable output."""
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.lower().endswith('.gif'):
+                paths.append(os.path.join(dirpath, name))
+    return sorted(paths)
+
+def normalize_frame(frame):
+    """Convert a frame to RGBA with every transparent pixel set to CLEAR.
+
+    GIF transparency is binary, so the alpha channel doubles as the mask and
+    the colour hidden behind a transparent pixel no longer matters.
+    """
+    rgba = frame.convert('RGBA')
+    alpha = rgba.getchannel('A')
+    if alpha.getextrema()[0] == 255:
+        return rgba
+    return Image.composite(rgba, Image.new('RGBA', rgba.size, CLEAR), alpha)
+
+def decode_frames(image):
+    """Decode an open GIF into (composited RGBA frame, duration ms) pairs."""
+    frames = []
+    for frame in ImageSequence.Iterator(image):
+        duration = frame.info.get('duration', 0)
+        frames.append((normalize_frame(frame), duration))
+    return frames
+
+def frames_equal(a, b):
+    """Return True if two normalized RGBA frames are pixel-identical."""
+    return ImageChops.difference(a, b).getbbox(alpha_only=False) is None
+
+def merge_identical_frames(frames):
+    """Merge consecutive identical frames, summing their durations."""
+    merged = []
+    for frame, duration in frames:
+        if merged and frames_equal(merged[-1][0], frame):
+            merged[-1] = (merged[-1][0], merged[-1][1] + duration)
+        else:
+            merged.append((frame, duration))
+    return merged
+
+def choose_disposal(palette):
+    """GIF disposal method for frames on this palette.
+
+    Keeping the previous frame (1) lets each frame store only its changed
+    region. Transparent pixels cannot be drawn over an opaque canvas, so
+    GIFs that use them restore to background (2) instead.
+    """
+    _, transparent_index = palette
+    return 1 if transparent_index is None else 2
+
+def encoded_region(previous, frame, disposal):
+    """Bounding box the writer stores for frame, or None if it is empty.
+
+    With disposal 1 that is the region that differs from the previous frame;
+    with disposal 2 it is the frame's non-transparent area.
+    """
+    if previous is None:
+        return (0, 0) + frame.size
+    if disposal == 2:
+        return frame.getbbox()
+    return ImageChops.difference(previous, frame).getbbox(alpha_only=False)
+
+def build_palette(frames):
+    """Collect every colour used across all frames into one shared palette.
+
+    Returns (colors, transparent_index), or None if the frames need more
+    colours than a single GIF palette can hold.
+    """
+    colors = set()
+    for frame, _ in frames:
+        used = frame.getcolors(MAX_COLORS)
+        if used is None:
+            return None
+        colors.update(color for _, color in used)
+        if len(colors) > MAX_COLORS:
+            return None
+
+    # Transparent pixels get their own entry, kept last
+    has_clear = CLEAR in colors
+    colors.discard(CLEAR)
+    colors = sorted(colors)
+    transparent_index = None
+    if has_clear:
+        transparent_index = len(colors)
+        colors.append(CLEAR)
+    return colors, transparent_index
+
+def to_palette_frame(frame, colors, lookup):
+    """Map an RGBA frame onto the shared palette exactly (no nearest-colour search)."""
+    bands = [band.tobytes() for band in frame.split()]
+    indices = bytes(map(lookup.__getitem__, zip(*bands)))
+    img = Image.frombytes('P', frame.size, indices)
+    flat = [value for color in colors for value in color[:3]]
+    img.putpalette(flat)
+    return img
+
+def encode_gif(frames, palette, info):
+    """Encode merged frames onto the shared palette and return the GIF bytes."""
+    colors, transparent_index = palette
+    lookup = {color: i for i, color in enumerate(colors)}
+    images = [to_palette_frame(frame, colors, lookup) for frame, _ in frames]
+    durations = [duration for _, duration in frames]
+
+    save_kwargs = dict(
+        save_all=True,
+        append_images=images[1:],
+        duration=durations,
+        disposal=choose_disposal(palette),
+        optimize=True,
+        palette=images[0].getpalette(),
+    )
+    if 'loop' in info:
+        save_kwargs['loop'] = info['loop']
+    if transparent_index is not None:
+        save_kwargs['transparency'] = transparent_index
+
+    buffer = io.BytesIO()
+    images[0].save(buffer, 'GIF', **save_kwargs)
+    return buffer.getvalue()
+
+def timeline(frames):
+    """Merge identical neighbours and return (frame, start, end, index) spans.
+
+    index is the position of the span's first frame in the input. Zero-length
+    frames that differ from their neighbours stay as empty spans.
+    """
+    spans = []
+    start = 0
+    for index, (frame, duration) in enumerate(frames):
+        end = start + duration
+        if spans and frames_equal(spans[-1][0], frame):
+            spans[-1] = (spans[-1][0], spans[-1][1], end, spans[-1][3])
+        else:
+            spans.append((frame, start, end, index))
+        start = end
+    return spans
+
+def verify_frames(original, optimized):
+    """Check that both GIFs show the same pixels at every moment.
+
+    Walks both timelines together, comparing the frames over every interval
+    between the union of their frame boundaries. Zero-length frames are
+    compared in order, so they must appear on both sides. Returns a list of
+    problems; an empty list means the GIFs are identical.
+    """
+    problems = []
+    original_total = sum(duration for _, duration in original)
+    optimized_total = sum(duration for _, duration in optimized)
+    if original_total != optimized_total:
+        problems.append(f"duration {original_total}ms != {optimized_total}ms")
+
+    expected = timeline(original)
+    actual = timeline(optimized)
+    i = j = 0
+    while i < len(expected) and j < len(actual):
+        frame, start, end, index = expected[i]
+        other, other_start, other_end, _ = actual[j]
+        if not frames_equal(frame, other):
+            problems.append(f"frame {index} differs at {max(start, other_start)}ms")
+
+        # Advance whichever span ends first; an empty span only matches an empty span
+        if (end == start) != (other_end == other_start):
+            if end == start:
+                i += 1
+            else:
+                j += 1
+        else:
+            if end <= other_end:
+                i += 1
+            if other_end <= end:
+                j += 1
+
+    for _, start, _, index in expected[i:]:
+        problems.append(f"frame {index} missing at {start}ms")
+    for _, start, _, index in actual[j:]:
+        problems.append(f"extra frame {index} at {start}ms")
+    return problems
+
+def optimize_gif(path, write=True):
+    """Re-optimize one GIF in place. Returns (old_size, new_size, message)."""
+    old_size = os.path.getsize(path)
+
+    with Image.open(path) as image:
+        info = dict(image.info)
+        original = decode_frames(image)
+
+    merged = merge_identical_frames(original)
+    palette = build_palette(merged)
+    if palette is None:
+        return old_size, old_size, f"skipped: more than {MAX_COLORS} colours"
+
+    data = encode_gif(merged, palette, info)
+
+    with Image.open(io.BytesIO(data)) as image:
+        optimized = decode_frames(image)
+    problems = verify_frames(original, optimized)
+    if problems:
+        return old_size, old_size, "FAILED verification: " + "; ".join(problems[:3])
+
+    disposal = choose_disposal(palette)
+    previous = None
+    encoded_pixels = 0
+    for frame, _ in merged:
+        bbox = encoded_region(previous, frame, disposal)
+        if bbox:
+            encoded_pixels += (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        previous = frame
+    canvas_pixels = original[0][0].size[0] * original[0][0].size[1] * len(merged)
+
+    message = (
+        f"{len(original)} → {len(merged)} frames, "
+        f"{len(palette[0])} colours, "
+        f"{encoded_pixels / canvas_pixels:.0%} of canvas encoded, verified"
+    )
+
+    new_size = len(data)
+    if new_size >= old_size:
+        return old_size, old_size, message + ", original is already smaller, kept"
+
+    if write:
+        with open(path, 'wb') as f:
+            f.write(data)
+    return old_size, new_size, message
+
+def main():
+    args = sys.argv[1:]
+    write = '--verify' not in args
+    paths = [a for a in args if not a.startswith('--')]
+
+    if not paths:
+        assets_dir = os.path.join(os.path.dirname(__file__), 'assets')
+        paths = find_gifs(assets_dir)
+
+    mode = "Optimizing" if write else "Verifying"
+    print(f"{mode} {len(paths)} GIFs...")
+
+    total_old = 0
+    total_new = 0
+    failed = False
+    for path in paths:
+        old_size, new_size, message = optimize_gif(path, write=write)
+        total_old += old_size
+        total_new += new_size
+        failed = failed or message.startswith("FAILED")
+        saved = old_size - new_size
+        mark = "✗" if message.startswith("FAILED") else "✓"
+        print(f"  {mark} {os.path.relpath(path)}: {old_size / 1024:.1f} KB → {new_size / 1024:.1f} KB "
+              f"(-{saved / 1024:.1f} KB, {saved / old_size:.0%})")
+        print(f"      {message}")
+
+    saved = total_old - total_new
+    if total_old:
+        print(f"\nTotal: {total_old / 1024:.1f} KB → {total_new / 1024:.1f} KB "
+              f"(-{saved / 1024:.1f} KB, {saved / total_old:.0%})")
+    if not write:
+        print("Dry run: no files were written.")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()